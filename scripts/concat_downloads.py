@@ -39,7 +39,7 @@ print(f"\nDate range: {earliest} to {latest}")
 # Read and concatenate all files
 print("\nReading and concatenating files...")
 frames = [pl.read_csv(f) for f in files]
-df = pl.concat(frames, how="vertical", rechunk=True)
+df = pl.concat(frames, how="vertical", rechunk=False)
 
 # Write output
 output_path = Path("downloads") / f"openairframes_adsb_{earliest}_{latest}.csv.gz"
@@ -164,7 +164,9 @@ def load_parquet_part(part_id: int, date: str) -> pl.DataFrame:
     print(f"Loading from parquet: {parquet_file}")
     df = pl.read_parquet(
         parquet_file,
-        columns=['time', 'icao', 'r', 't', 'dbFlags', 'ownOp', 'year', 'desc', 'aircraft_category']
+        columns=['time', 'icao', 'r', 't', 'dbFlags', 'ownOp', 'year', 'desc', 'aircraft_category'],
+        rechunk=False,
+        low_memory=True,
     )
     
     # Convert to timezone-naive datetime
@@ -15,23 +15,37 @@ def main():
     date_dir = compressed_dir / args.date
 
     parquet_files = sorted(date_dir.glob("*.parquet"))
-    df = None
+    lf = None
     if parquet_files: # TODO: This logic could be updated slightly.
         print(f"No parquet files found in {date_dir}")
 
-        frames = [pl.read_parquet(p) for p in parquet_files]
-        df = pl.concat(frames, how="vertical", rechunk=True)
+        # Lazy scan + streaming sinks keep peak memory bounded: the sort and
+        # the writes run in one pipeline instead of materializing every file.
+        lf = pl.scan_parquet(str(date_dir / "*.parquet"))
+        # The part files cannot be merge-concatenated instead of sorted: each
+        # part is an icao bucket (ordered by icao, one row per icao) whose
+        # time ranges fully overlap the other parts, so a real sort on
+        # (time, icao) is required here.
+        lf = lf.sort(["time", "icao"])
+        lf = lf.select(CORRECT_ORDER_OF_COLUMNS)
 
-        df = df.sort(["time", "icao"])
-        df = df.select(CORRECT_ORDER_OF_COLUMNS)
-        
         output_path = OUTPUT_DIR / f"openairframes_adsb_{args.date}.parquet"
-        print(f"Writing combined parquet to {output_path} with {df.height} rows")
-        df.write_parquet(output_path)
+        print(f"Writing combined parquet to {output_path}")
+        # Large row groups keep downstream scans parallel without paying for
+        # many tiny groups. The data is sorted by (time, icao), so min/max
+        # stats are trivially tight and enable predicate pushdown for readers;
+        # distinct-count stats are not worth computing.
+        lf.sink_parquet(
+            output_path,
+            compression="zstd",
+            compression_level=3,
+            row_group_size=1_000_000,
+            statistics={"min": True, "max": True, "distinct_count": False, "null_count": True},
+        )
 
         csv_output_path = OUTPUT_DIR / f"openairframes_adsb_{args.date}.csv.gz"
-        print(f"Writing combined csv.gz to {csv_output_path} with {df.height} rows")
-        df.write_csv(csv_output_path, compression="gzip")
+        print(f"Writing combined csv.gz to {csv_output_path}")
+        lf.sink_csv(csv_output_path, compression="gzip")
 
     if args.concat_with_latest_csv:
         print("Loading latest CSV from GitHub releases to concatenate with...")
@@ -45,7 +59,7 @@ def main():
         csv_end_dt = datetime.strptime(csv_end_date, "%Y-%m-%d")
         args_dt = datetime.strptime(args.date, "%Y-%m-%d")
         
-        if df is None or csv_end_dt >= args_dt:
+        if lf is None or csv_end_dt >= args_dt:
             print(f"Latest CSV already includes data through {args.date} (end_date={csv_end_date} is exclusive)")
             print("Writing latest CSV directly without concatenation to avoid duplicates")
             os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -57,6 +71,7 @@ def main():
             # Ensure column order matches before concatenating
             df_latest_csv = df_latest_csv.select(CORRECT_ORDER_OF_COLUMNS)
             from src.adsb.compress_adsb_to_aircraft_data import concat_compressed_dfs
+            df = lf.collect(engine="streaming")
             df_final = concat_compressed_dfs(df_latest_csv, df)
             df_final = df_final.select(CORRECT_ORDER_OF_COLUMNS)
             final_csv_output_path = OUTPUT_DIR / f"openairframes_adsb_{csv_start_date}_{args.date}.csv.gz"
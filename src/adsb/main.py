@@ -6,6 +6,8 @@ Usage:
     python -m src.adsb.main --start_date 2026-01-01 --end_date 2026-01-03
 """
 import argparse
+import concurrent.futures
+import os
 import subprocess
 import sys
 from datetime import datetime, timedelta
@@ -13,6 +15,7 @@ from datetime import datetime, timedelta
 import polars as pl
 
 from src.adsb.download_and_list_icaos import NUMBER_PARTS
+from src.adsb.process_icao_chunk import run as run_icao_chunk
 
 
 def main():
@@ -43,9 +46,18 @@ def main():
         # Download and split
         subprocess.run([sys.executable, "-m", "src.adsb.download_and_list_icaos", "--date", date_str], check=True)
 
-        # Process parts
-        for part_id in range(NUMBER_PARTS):
-            subprocess.run([sys.executable, "-m", "src.adsb.process_icao_chunk", "--part-id", str(part_id), "--date", date_str], check=True)
+        # Process parts in parallel - they are independent per part-id.
+        # ADSB_PARALLEL_PARTS tunes the worker count (e.g. down to 1 on IO-bound hosts).
+        max_workers = int(os.environ.get("ADSB_PARALLEL_PARTS", min(NUMBER_PARTS, os.cpu_count() or 1)))
+        # Each part runs in a pool worker forked from this already-imported
+        # process, skipping a fresh interpreter startup per part.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_icao_chunk, part_id, date_str)
+                for part_id in range(NUMBER_PARTS)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()  # Re-raise the first failing part's exception
 
         # Concatenate
         concat_cmd = [sys.executable, "-m", "src.adsb.concat_parquet_to_final", "--date", date_str]
@@ -65,10 +77,11 @@ def main():
             f"data/outputs/openairframes_adsb_{d}_{d}.csv"
             for d in dates
         ]
-        frames = [pl.read_csv(p) for p in csv_files]
-        df = pl.concat(frames, how="vertical", rechunk=True)
+        # Stream the per-day CSVs straight into the combined output instead of
+        # materializing every file in memory first.
+        lf = pl.concat([pl.scan_csv(p) for p in csv_files], how="vertical", rechunk=False)
         output_path = f"data/outputs/openairframes_adsb_{start_date.strftime('%Y-%m-%d')}_{end_date.strftime('%Y-%m-%d')}.csv"
-        df.write_csv(output_path)
+        lf.sink_csv(output_path)
         print(f"Wrote combined CSV: {output_path}")
 
     print("Done")
@@ -114,18 +114,18 @@ def process_chunk(
 
 from pathlib import Path
 
-def main():
-    parser = argparse.ArgumentParser(description="Process a single archive part for a day")
-    parser.add_argument("--part-id", type=int, required=True, help="Part ID (1-indexed)")
-    parser.add_argument("--date", type=str, required=True, help="Date in YYYY-MM-DD format")
-    args = parser.parse_args()
-    
-    print(f"Processing part {args.part_id} for {args.date}")
-    
+def run(part_id: int, date: str) -> None:
+    """Process one archive part for a day.
+
+    Importable entry point so the pipeline can run parts in a warm process
+    pool without paying interpreter startup per part.
+    """
+    print(f"Processing part {part_id} for {date}")
+
     # Get specific archive file for this part
-    archive_dir = os.path.join(OUTPUT_DIR, "adsb_archives", args.date)
-    archive_path = os.path.join(archive_dir, f"{args.date}_part_{args.part_id}.tar.gz")
-    
+    archive_dir = os.path.join(OUTPUT_DIR, "adsb_archives", date)
+    archive_path = os.path.join(archive_dir, f"{date}_part_{part_id}.tar.gz")
+
     if not os.path.isfile(archive_path):
         print(f"ERROR: Archive not found: {archive_path}")
         if os.path.isdir(archive_dir):
@@ -133,32 +133,41 @@ def main():
         else:
             print(f"Directory does not exist: {archive_dir}")
         sys.exit(1)
-    
+
     # Extract and collect trace files
     trace_map = build_trace_file_map(archive_path)
     all_trace_files = list(trace_map.values())
-    
+
     print(f"Total trace files: {len(all_trace_files)}")
-    
+
     # Process and write output
-    output_path = process_chunk(all_trace_files, args.part_id, args.date)
-    
+    output_path = process_chunk(all_trace_files, part_id, date)
+
     from src.adsb.compress_adsb_to_aircraft_data import compress_parquet_part
-    df_compressed = compress_parquet_part(args.part_id, args.date)
-    
+    df_compressed = compress_parquet_part(part_id, date)
+
     # Write parquet
-    df_compressed_output = OUTPUT_DIR / "compressed" / args.date/ f"part_{args.part_id}_{args.date}.parquet"
+    df_compressed_output = OUTPUT_DIR / "compressed" / date / f"part_{part_id}_{date}.parquet"
     os.makedirs(df_compressed_output.parent, exist_ok=True)
     df_compressed.write_parquet(df_compressed_output, compression='snappy')
-    
+
     # Write CSV
-    csv_output = OUTPUT_DIR / "compressed" / args.date / f"part_{args.part_id}_{args.date}.csv"
+    csv_output = OUTPUT_DIR / "compressed" / date / f"part_{part_id}_{date}.csv"
     df_compressed.write_csv(csv_output)
-    
+
     print(f"Raw output: {output_path}" if output_path else "No raw output generated")
     print(f"Compressed parquet: {df_compressed_output}")
     print(f"Compressed CSV: {csv_output}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Process a single archive part for a day")
+    parser.add_argument("--part-id", type=int, required=True, help="Part ID (1-indexed)")
+    parser.add_argument("--date", type=str, required=True, help="Date in YYYY-MM-DD format")
+    args = parser.parse_args()
+
+    run(args.part_id, args.date)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
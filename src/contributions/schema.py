@@ -1,4 +1,5 @@
 """Schema validation for community submissions."""
+import functools
 import json
 import re
 from pathlib import Path
@@ -9,12 +10,27 @@ try:
 except ImportError:
     Draft202012Validator = None
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
 SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
 
 # For backwards compatibility
 SCHEMA_PATH = SCHEMAS_DIR / "community_submission.v1.schema.json"
 
+# Precompiled patterns for issue-body parsing - these helpers run in bulk
+# (e.g. scanning many issues in CI), so compile once at import time.
+_RE_ATTACHMENT = re.compile(
+    r"### Submission JSON\s*\n[\s\S]*?(https://github\.com/(?:user-attachments/files|.*?/files)/[^\s\)\]]+\.json)"
+)
+_RE_ATTACHMENT_ALT = re.compile(r"\[.*?\.json\]\((https://github\.com/[^\)]+)\)")
+_RE_CODEBLOCK = re.compile(r"### Submission JSON\s*\n\s*```(?:json)?\s*\n([\s\S]*?)\n\s*```")
+_RE_RAW = re.compile(r"### Submission JSON\s*\n\s*([\[{][\s\S]*[\]}])(?=\s*\n###|\s*$)")
+_RE_CONTRIBUTOR_NAME = re.compile(r"### Contributor Name\s*\n\s*(.+?)(?=\n###|\n\n|$)")
+
 
 def get_latest_schema_version() -> int:
     """
@@ -82,6 +98,63 @@ def _is_balanced_json(text: str) -> bool:
     return len(stack) == 0 and not in_string
 
 
+def _extract_balanced_json(text: str) -> str | None:
+    """
+    Extract the first balanced JSON object/array from text.
+
+    Finds the first '{' or '[' and walks forward maintaining a bracket
+    stack, ignoring brackets inside strings. Single O(n) pass with no
+    regex backtracking.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        The balanced JSON substring, or None if none found
+    """
+    start = -1
+    for i, char in enumerate(text):
+        if char in '[{':
+            start = i
+            break
+    if start == -1:
+        return None
+
+    in_string = False
+    escape = False
+    stack = []
+    pairs = {'[': ']', '{': '}'}
+
+    for i in range(start, len(text)):
+        char = text[i]
+
+        if escape:
+            escape = False
+            continue
+
+        if char == '\\':
+            escape = True
+            continue
+
+        if char == '"':
+            in_string = not in_string
+            continue
+
+        if in_string:
+            continue
+
+        if char in pairs:
+            stack.append(char)
+        elif char in pairs.values():
+            if not stack or pairs[stack[-1]] != char:
+                return None
+            stack.pop()
+            if not stack:
+                return text[start:i + 1]
+
+    return None
+
+
 def get_schema_path(version: int | None = None) -> Path:
     """
     Get path to a specific schema version, or latest if version is None.
@@ -97,19 +170,59 @@ def get_schema_path(version: int | None = None) -> Path:
     return SCHEMAS_DIR / f"community_submission.v{version}.schema.json"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_schema_file(schema_path: Path) -> dict:
+    with open(schema_path) as f:
+        return json.load(f)
+
+
 def load_schema(version: int | None = None) -> dict:
     """
     Load the community submission schema.
-    
+
+    The parsed schema is cached per path, so batch flows that validate many
+    submissions don't reparse the JSON each time. Callers must not mutate
+    the returned dict; copy it first if needed.
+
     Args:
         version: Schema version to load. If None, loads the latest version.
-        
+
     Returns:
         Schema dict
     """
-    schema_path = get_schema_path(version)
-    with open(schema_path) as f:
-        return json.load(f)
+    return _load_schema_file(get_schema_path(version))
+
+
+# Compiled validators, keyed by id() of the schema dict. The schema is kept
+# in the value so the id stays valid for as long as the entry exists.
+_validator_cache: dict[int, tuple[dict, Any]] = {}
+
+
+def _get_validator(schema: dict):
+    cached = _validator_cache.get(id(schema))
+    if cached is None:
+        cached = (schema, Draft202012Validator(schema))
+        _validator_cache[id(schema)] = cached
+    return cached[1]
+
+
+# fastjsonschema-compiled validators, keyed like _validator_cache. An entry
+# of None means the schema couldn't be compiled and we fall back entirely.
+_fast_validator_cache: dict[int, tuple[dict, Any]] = {}
+
+
+def _get_fast_validator(schema: dict):
+    if fastjsonschema is None:
+        return None
+    cached = _fast_validator_cache.get(id(schema))
+    if cached is None:
+        try:
+            compiled = fastjsonschema.compile(schema)
+        except Exception:
+            compiled = None
+        cached = (schema, compiled)
+        _fast_validator_cache[id(schema)] = cached
+    return cached[1]
 
 
 def validate_submission(data: dict | list, schema: dict | None = None) -> list[str]:
@@ -131,15 +244,28 @@ def validate_submission(data: dict | list, schema: dict | None = None) -> list[s
     
     submissions = data if isinstance(data, list) else [data]
     errors = []
-    
-    validator = Draft202012Validator(schema)
-    
+    tagged = len(submissions) > 1
+
+    # Fast-accept path: fastjsonschema compiles the schema down to a
+    # specialized function. Submissions that pass skip jsonschema entirely;
+    # failures fall through to iter_errors for the detailed messages.
+    fast_validate = _get_fast_validator(schema)
+
+    validator = _get_validator(schema)
+    iter_errors = validator.iter_errors
+
     for i, submission in enumerate(submissions):
-        prefix = f"[{i}] " if len(submissions) > 1 else ""
-        for error in validator.iter_errors(submission):
-            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
+        if fast_validate is not None:
+            try:
+                fast_validate(submission)
+                continue
+            except fastjsonschema.JsonSchemaException:
+                pass
+        prefix = f"[{i}] " if tagged else ""
+        for error in iter_errors(submission):
+            path = ".".join(map(str, error.path)) if error.path else "(root)"
             errors.append(f"{prefix}{path}: {error.message}")
-    
+
     return errors
 
 
@@ -183,8 +309,7 @@ def extract_json_from_issue_body(body: str) -> str | None:
     # Try: GitHub attachment URL in the Submission JSON section
     # Format: [filename.json](https://github.com/user-attachments/files/...)
     # Or just the raw URL
-    pattern_attachment = r"### Submission JSON\s*\n[\s\S]*?(https://github\.com/(?:user-attachments/files|.*?/files)/[^\s\)\]]+\.json)"
-    match = re.search(pattern_attachment, body)
+    match = _RE_ATTACHMENT.search(body)
     if match:
         url = match.group(1)
         content = download_github_attachment(url)
@@ -192,8 +317,7 @@ def extract_json_from_issue_body(body: str) -> str | None:
             return content.strip()
     
     # Also check for GitHub user-attachments URL anywhere in submission section
-    pattern_attachment_alt = r"\[.*?\.json\]\((https://github\.com/[^\)]+)\)"
-    match = re.search(pattern_attachment_alt, body)
+    match = _RE_ATTACHMENT_ALT.search(body)
     if match:
         url = match.group(1)
         if ".json" in url or "user-attachments" in url:
@@ -202,32 +326,24 @@ def extract_json_from_issue_body(body: str) -> str | None:
                 return content.strip()
     
     # Try: JSON in code blocks after "### Submission JSON"
-    pattern_codeblock = r"### Submission JSON\s*\n\s*```(?:json)?\s*\n([\s\S]*?)\n\s*```"
-    match = re.search(pattern_codeblock, body)
+    match = _RE_CODEBLOCK.search(body)
     if match:
         return match.group(1).strip()
     
     # Try: Raw JSON after "### Submission JSON" until next section or end
     # Use greedy matching since we have a clear boundary (next ### or end)
-    pattern_raw = r"### Submission JSON\s*\n\s*([\[{][\s\S]*[\]}])(?=\s*\n###|\s*$)"
-    match = re.search(pattern_raw, body)
+    match = _RE_RAW.search(body)
     if match:
         candidate = match.group(1).strip()
         # Validate it's complete JSON by checking balanced brackets
         if _is_balanced_json(candidate):
             return candidate
     
-    # Try: Any JSON object/array in the body (fallback)
-    pattern_any = r"([\[{][\s\S]*?[\]}])"
-    for match in re.finditer(pattern_any, body):
-        candidate = match.group(1).strip()
-        # Validate it looks like JSON
-        if candidate.startswith('{') and candidate.endswith('}'):
-            return candidate
-        if candidate.startswith('[') and candidate.endswith(']'):
-            return candidate
-    
-    return None
+    # Try: Any balanced JSON object/array in the body (fallback).
+    # A bracket-depth scan avoids the catastrophic backtracking a non-greedy
+    # regex can hit on bodies with many brackets, and captures the full JSON
+    # instead of stopping at the first closing bracket.
+    return _extract_balanced_json(body)
 
 
 def extract_contributor_name_from_issue_body(body: str) -> str | None:
@@ -243,8 +359,7 @@ def extract_contributor_name_from_issue_body(body: str) -> str | None:
         Contributor name string or None if not found/empty
     """
     # Match "### Contributor Name" section
-    pattern = r"### Contributor Name\s*\n\s*(.+?)(?=\n###|\n\n|$)"
-    match = re.search(pattern, body)
+    match = _RE_CONTRIBUTOR_NAME.search(body)
     
     if match:
         name = match.group(1).strip()
@@ -16,6 +16,11 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .read_community_data import read_all_submissions, build_tag_type_registry
 from .schema import SCHEMAS_DIR, get_latest_schema_version, get_schema_path, load_schema
 
@@ -26,18 +31,23 @@ def get_existing_tag_definitions(schema: dict) -> dict[str, dict]:
     return tags_props
 
 
+# Prebuilt JSON Schema fragments per registry type name. These are shared
+# (never mutated), so they don't need to be rebuilt for every tag.
+_TAG_VALUE_REF = {"$ref": "#/$defs/tagValue"}
+_TYPE_MAP = {
+    "string": {"type": "string"},
+    "integer": {"type": "integer"},
+    "number": {"type": "number"},
+    "boolean": {"type": "boolean"},
+    "null": {"type": "null"},
+    "array": {"type": "array", "items": {"$ref": "#/$defs/tagScalar"}},
+    "object": {"type": "object", "additionalProperties": {"$ref": "#/$defs/tagScalar"}},
+}
+
+
 def type_name_to_json_schema(type_name: str) -> dict:
     """Convert a type name to a JSON Schema type definition."""
-    type_map = {
-        "string": {"type": "string"},
-        "integer": {"type": "integer"},
-        "number": {"type": "number"},
-        "boolean": {"type": "boolean"},
-        "null": {"type": "null"},
-        "array": {"type": "array", "items": {"$ref": "#/$defs/tagScalar"}},
-        "object": {"type": "object", "additionalProperties": {"$ref": "#/$defs/tagScalar"}},
-    }
-    return type_map.get(type_name, {"$ref": "#/$defs/tagValue"})
+    return _TYPE_MAP.get(type_name, _TAG_VALUE_REF)
 
 
 def generate_updated_schema(base_schema: dict, tag_registry: dict[str, str]) -> dict:
@@ -51,17 +61,27 @@ def generate_updated_schema(base_schema: dict, tag_registry: dict[str, str]) ->
     Returns:
         Updated schema dict
     """
-    schema = json.loads(json.dumps(base_schema))  # Deep copy
-    
-    # Build tag properties with explicit types
-    tag_properties = {}
-    for tag_name, type_name in sorted(tag_registry.items()):
-        tag_properties[tag_name] = type_name_to_json_schema(type_name)
-    
+    # Only the tags properties block is replaced, so shallow-copy the dicts
+    # along that path instead of deep-copying the whole schema via a JSON
+    # round-trip. load_schema may return a cached dict, so the base schema
+    # must not be mutated.
+    schema = dict(base_schema)
+
+    # Build tag properties with explicit types. Keep the sort: the schema is
+    # committed, so key order must stay stable across regenerations.
+    tag_properties = {
+        tag_name: type_name_to_json_schema(type_name)
+        for tag_name, type_name in sorted(tag_registry.items())
+    }
+
     # Only add/update the properties key within tags, preserve everything else
     if "properties" in schema and "tags" in schema["properties"]:
-        schema["properties"]["tags"]["properties"] = tag_properties
-    
+        properties = dict(schema["properties"])
+        tags = dict(properties["tags"])
+        tags["properties"] = tag_properties
+        properties["tags"] = tags
+        schema["properties"] = properties
+
     return schema
 
 
@@ -73,7 +93,8 @@ def check_for_new_tags(tag_registry: dict[str, str], current_schema: dict) -> li
         List of new tag names
     """
     existing_tags = get_existing_tag_definitions(current_schema)
-    return [tag for tag in tag_registry if tag not in existing_tags]
+    # Dict views support set algebra in C; sorted for stable output.
+    return sorted(tag_registry.keys() - existing_tags.keys())
 
 
 def update_schema_file(
@@ -105,10 +126,18 @@ def update_schema_file(
     updated_schema = generate_updated_schema(current_schema, tag_registry)
     schema_path = get_schema_path()
     
-    with open(schema_path, "w") as f:
-        json.dump(updated_schema, f, indent=2)
-        f.write("\n")
-    
+    # orjson serializes several times faster than stdlib json. Keep indent=2
+    # for readable git diffs; keys are not re-sorted so the committed schema's
+    # existing order is preserved.
+    if orjson is not None:
+        with open(schema_path, "wb") as f:
+            f.write(orjson.dumps(updated_schema, option=orjson.OPT_INDENT_2))
+            f.write(b"\n")
+    else:
+        with open(schema_path, "w") as f:
+            json.dump(updated_schema, f, indent=2)
+            f.write("\n")
+
     return True, new_tags
 
 
@@ -0,0 +1,88 @@
+"""
+Reconstruct historical FAA MASTER files from the registry mirror's git history.
+
+The mirror repo commits the releasable database daily, with MASTER split into
+numbered parts (MASTER-1.txt, MASTER-2.txt, ...). For each February 2024
+commit this script reassembles the parts into a single Master.txt under
+data/faa_releasable_historical/<date>/, which combine_historical_faa.py then
+converts to releasable CSVs.
+
+Usage:
+    python -m src.get_historical_faa
+"""
+import os
+import re
+import shutil
+import subprocess
+import tarfile
+from pathlib import Path
+
+REPO_DIR = Path("data/faa-registry-git")
+OUTPUT_DIR = Path("data/faa_releasable_historical")
+
+PART_RE = re.compile(r"MASTER-(\d+)\.txt$")
+
+
+def run_git(*args: str) -> str:
+    return subprocess.check_output(["git", "-C", str(REPO_DIR), *args], text=True)
+
+
+def main():
+    # Let git filter by date instead of listing the whole history and
+    # discarding most of it in Python.
+    log = run_git(
+        "log", "--reverse",
+        "--since=2024-02-01", "--until=2024-03-01",
+        "--format=%H %cs", "--", "MASTER-1.txt",
+    )
+
+    for line in log.splitlines():
+        sha, date = line.split()
+        names = [n for n in run_git("ls-tree", "--name-only", sha).splitlines() if PART_RE.match(n)]
+        if not names:
+            continue
+
+        day_dir = OUTPUT_DIR / date
+        day_dir.mkdir(parents=True, exist_ok=True)
+
+        # One `git archive` per commit streams every part in a single fork,
+        # instead of paying fork+exec for a `git show` per part.
+        proc = subprocess.Popen(
+            ["git", "-C", str(REPO_DIR), "archive", "--format=tar", sha, "--", *names],
+            stdout=subprocess.PIPE,
+        )
+        # Stream each part to disk in 1MB chunks; a ~60MB part no longer
+        # needs a whole-file bytes object in Python.
+        part_paths = {}
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            for member in tar:
+                match = PART_RE.match(member.name)
+                if not match:
+                    continue
+                part_path = day_dir / member.name
+                with tar.extractfile(member) as src, open(part_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+                part_paths[int(match.group(1))] = part_path
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+        out_path = day_dir / "Master.txt"
+        with open(out_path, "wb") as w:
+            # Parts must be concatenated in numeric order (MASTER-10 sorts
+            # before MASTER-2 alphabetically in the tar stream).
+            for _, part_path in sorted(part_paths.items()):
+                last = b""
+                with open(part_path, "rb") as r:
+                    shutil.copyfileobj(r, w, length=1 << 20)
+                    if part_path.stat().st_size:
+                        r.seek(-1, os.SEEK_END)
+                        last = r.read(1)
+                if last != b"\n":
+                    w.write(b"\n")
+                part_path.unlink()
+
+        print(date, "->", out_path)
+
+
+if __name__ == "__main__":
+    main()